@@ -7,72 +7,16 @@ import os
 import sys
 import subprocess
 import shutil
+from importlib.util import find_spec
 from pathlib import Path
 
-class WindowsBuilder:
-    def __init__(self):
-        self.project_name = "TrochoidViewer"
-        self.main_script = "trochoid_viewer.py"
-        self.build_dir = Path("build")
-        self.dist_dir = Path("dist")
-        self.spec_file = f"{self.project_name}.spec"
-        
-    def check_requirements(self):
-        """Check if required packages are installed"""
-        print("=" * 60)
-        print("Checking required packages...")
-        print("=" * 60)
-        
-        required = ['PySide6', 'numpy', 'matplotlib', 'pyinstaller']
-        missing = []
-        
-        for package in required:
-            try:
-                __import__(package.lower().replace('-', '_'))
-                print(f"OK {package} - installed")
-            except ImportError:
-                print(f"NG {package} - not installed")
-                missing.append(package)
-        
-        if missing:
-            print("\nPlease install the following packages:")
-            print(f"pip install {' '.join(missing)}")
-            return False
-        
-        print("\nAll required packages are installed!")
-        return True
-    
-    def clean_build(self):
-        """Remove previous build files"""
-        print("\n" + "=" * 60)
-        print("Cleaning up...")
-        print("=" * 60)
-        
-        dirs_to_remove = [self.build_dir, self.dist_dir, "__pycache__"]
-        files_to_remove = [self.spec_file]
-        
-        for dir_path in dirs_to_remove:
-            if dir_path.exists():
-                shutil.rmtree(dir_path)
-                print(f"OK Removed {dir_path}")
-        
-        for file_path in files_to_remove:
-            if Path(file_path).exists():
-                os.remove(file_path)
-                print(f"OK Removed {file_path}")
-    
-    def create_spec_file(self):
-        """Create PyInstaller .spec file"""
-        print("\n" + "=" * 60)
-        print("Creating .spec file...")
-        print("=" * 60)
-        
-        spec_content = f"""# -*- mode: python ; coding: utf-8 -*-
+# PyInstaller .spec file template (filled in by WindowsBuilder.create_spec_file)
+SPEC_TEMPLATE = """# -*- mode: python ; coding: utf-8 -*-
 
 block_cipher = None
 
 a = Analysis(
-    ['{self.main_script}'],
+    ['{main_script}'],
     pathex=[],
     binaries=[],
     datas=[],
@@ -80,7 +24,7 @@ a = Analysis(
         'PySide6.QtCore',
         'PySide6.QtGui',
         'PySide6.QtWidgets',
-        'PySide6.QtSvgWidgets',
+        'PySide6.QtSvg',
         'matplotlib.backends.backend_qt5agg',
         'matplotlib.backends.backend_agg',
         'numpy',
@@ -94,6 +38,12 @@ a = Analysis(
         'tkinter',
         'PyQt5',
         'PyQt6',
+        'matplotlib.backends.backend_tkagg',
+        'matplotlib.backends.backend_gtk3agg',
+        'matplotlib.backends.backend_gtk4agg',
+        'matplotlib.backends.backend_wxagg',
+        'matplotlib.backends.backend_macosx',
+        'matplotlib.backends.backend_webagg',
     ],
     win_no_prefer_redirects=False,
     win_private_assemblies=False,
@@ -110,11 +60,11 @@ exe = EXE(
     a.zipfiles,
     a.datas,
     [],
-    name='{self.project_name}',
+    name='{project_name}',
     debug=False,
     bootloader_ignore_signals=False,
     strip=False,
-    upx=True,
+    upx=False,
     upx_exclude=[],
     runtime_tmpdir=None,
     console=False,
@@ -125,9 +75,89 @@ exe = EXE(
     entitlements_file=None,
 )
 """
+
+class WindowsBuilder:
+    def __init__(self, clean=True):
+        self.clean = clean
+        self.project_name = "TrochoidViewer"
+        self.main_script = "trochoid_viewer.py"
+        self.build_dir = Path("build")
+        self.dist_dir = Path("dist")
+        self.spec_file = f"{self.project_name}.spec"
+        self._requirements_ok = False
+        
+    def check_requirements(self):
+        """Check if required packages are installed"""
+        if self._requirements_ok:
+            return True
+        
+        print("=" * 60)
+        print("Checking required packages...")
+        print("=" * 60)
+        
+        # pip package name -> import name (find_spec only locates the
+        # module, it does not import PySide6/matplotlib)
+        required = {
+            'PySide6': 'PySide6',
+            'numpy': 'numpy',
+            'matplotlib': 'matplotlib',
+            'pyinstaller': 'PyInstaller',
+        }
+        missing = []
+        
+        for package, module in required.items():
+            if find_spec(module) is not None:
+                print(f"OK {package} - installed")
+            else:
+                print(f"NG {package} - not installed")
+                missing.append(package)
+        
+        if missing:
+            print("\nPlease install the following packages:")
+            print(f"pip install {' '.join(missing)}")
+            return False
+        
+        print("\nAll required packages are installed!")
+        self._requirements_ok = True
+        return True
+    
+    def clean_build(self):
+        """Remove previous build files"""
+        print("\n" + "=" * 60)
+        print("Cleaning up...")
+        print("=" * 60)
+        
+        dirs_to_remove = [self.build_dir, self.dist_dir, "__pycache__"]
+        files_to_remove = [self.spec_file]
+        
+        for dir_path in dirs_to_remove:
+            if dir_path.exists():
+                shutil.rmtree(dir_path)
+                print(f"OK Removed {dir_path}")
+        
+        for file_path in files_to_remove:
+            if Path(file_path).exists():
+                os.remove(file_path)
+                print(f"OK Removed {file_path}")
+    
+    def create_spec_file(self):
+        """Create PyInstaller .spec file"""
+        print("\n" + "=" * 60)
+        print("Creating .spec file...")
+        print("=" * 60)
+        
+        spec_content = SPEC_TEMPLATE.format(
+            main_script=self.main_script,
+            project_name=self.project_name,
+        )
+        
+        # Leave an unchanged spec alone so PyInstaller can reuse its cache
+        spec_path = Path(self.spec_file)
+        if spec_path.exists() and spec_path.read_text(encoding='utf-8') == spec_content:
+            print(f"OK {self.spec_file} is up to date")
+            return
         
-        with open(self.spec_file, 'w', encoding='utf-8') as f:
-            f.write(spec_content)
+        spec_path.write_text(spec_content, encoding='utf-8')
         
         print(f"OK Created {self.spec_file}")
     
@@ -139,10 +169,10 @@ exe = EXE(
         print("This may take several minutes...")
         
         try:
-            subprocess.run(
-                ['pyinstaller', '--clean', self.spec_file],
-                check=True
-            )
+            command = ['pyinstaller', self.spec_file]
+            if self.clean:
+                command.insert(1, '--clean')
+            subprocess.run(command, check=True)
             
             print("\n" + "=" * 60)
             print("Build completed!")
@@ -199,8 +229,7 @@ If you encounter problems, please provide a screenshot of the error message.
 """
         
         readme_path = self.dist_dir / "README.txt"
-        with open(readme_path, 'w', encoding='utf-8') as f:
-            f.write(readme_content)
+        readme_path.write_text(readme_content, encoding='utf-8')
         
         print(f"\nOK Created {readme_path}")
     
@@ -215,7 +244,8 @@ If you encounter problems, please provide a screenshot of the error message.
             print("Command: pip install -r requirements.txt")
             return False
         
-        self.clean_build()
+        if self.clean:
+            self.clean_build()
         self.create_spec_file()
         
         if not self.build_exe():
@@ -232,7 +262,8 @@ If you encounter problems, please provide a screenshot of the error message.
 
 def main():
     """Main process"""
-    builder = WindowsBuilder()
+    # --incremental keeps build/ and the PyInstaller cache from the last run
+    builder = WindowsBuilder(clean='--incremental' not in sys.argv[1:])
     
     if not Path(builder.main_script).exists():
         print(f"Error: {builder.main_script} not found")
@@ -1,17 +1,85 @@
-import os
+import sys
+import string
+import hashlib
+import functools
 from pathlib import Path
 
-def create_inno_script():
-    """Inno Setup用のスクリプトを生成"""
+# Inno Setup スクリプトのひな形（$ で始まる部分をアプリ情報で置き換える）
+INNO_SCRIPT_TEMPLATE = string.Template("""; Inno Setup Script for Trochoid Viewer
+#define MyAppName "${app_name}"
+#define MyAppVersion "${app_version}"
+#define MyAppPublisher "${app_publisher}"
+#define MyAppExeName "${app_exe}"
+
+[Setup]
+AppId={{${app_guid}}
+AppName={#MyAppName}
+AppVersion={#MyAppVersion}
+AppPublisher={#MyAppPublisher}
+DefaultDirName={autopf}\\TrochoidViewer
+DefaultGroupName={#MyAppName}
+OutputDir=installer
+OutputBaseFilename=TrochoidViewer_Setup
+Compression=lzma
+SolidCompression=yes
+WizardStyle=modern
+
+[Languages]
+Name: "japanese"; MessagesFile: "compiler:Languages\\Japanese.isl"
+
+[Tasks]
+Name: "desktopicon"; Description: "デスクトップにショートカットを作成"; GroupDescription: "追加のアイコン:"
+
+[Files]
+Source: "dist\\${app_exe}"; DestDir: "{app}"; Flags: ignoreversion
+Source: "dist\\README.txt"; DestDir: "{app}"; Flags: ignoreversion
+
+[Icons]
+Name: "{group}\\{#MyAppName}"; Filename: "{app}\\{#MyAppExeName}"
+Name: "{group}\\README"; Filename: "{app}\\README.txt"
+Name: "{autodesktop}\\{#MyAppName}"; Filename: "{app}\\{#MyAppExeName}"; Tasks: desktopicon
+
+[Run]
+Filename: "{app}\\{#MyAppExeName}"; Description: "アプリケーションを起動"; Flags: nowait postinstall skipifsilent
+""")
+
+@functools.lru_cache(maxsize=16)
+def render_inno_script(app_name="トロコイド系曲線ビューアー", app_version="1.0.0",
+                       app_publisher="Your Name", app_exe="TrochoidViewer.exe",
+                       app_guid="YOUR-GUID-HERE"):
+    """アプリ情報を埋め込んだスクリプトを UTF-8 のバイト列で返す（同じ引数なら再生成しない）"""
+    return INNO_SCRIPT_TEMPLATE.substitute(
+        app_name=app_name,
+        app_version=app_version,
+        app_publisher=app_publisher,
+        app_exe=app_exe,
+        app_guid=app_guid,
+    ).encode('utf-8')
+
+def create_inno_script(**app_info):
+    """Inno Setup用のスクリプトを生成し、(パス, 内容のハッシュ) を返す（ハッシュは ISCC 再実行の判定用）"""
+    script_bytes = render_inno_script(**app_info)
+    digest = hashlib.blake2b(script_bytes, digest_size=16).hexdigest()
     
-    script_content = """ ; Inno Setup Script for Trochoid Viewer #define MyAppName "トロコイド系曲線ビューアー" #define MyAppVersion "1.0.0" #define MyAppPublisher "Your Name" #define MyAppExeName "TrochoidViewer.exe" [Setup] AppId={{YOUR-GUID-HERE}} AppName={#MyAppName} AppVersion={#MyAppVersion} AppPublisher={#MyAppPublisher} DefaultDirName={autopf}\\TrochoidViewer DefaultGroupName={#MyAppName} OutputDir=installer OutputBaseFilename=TrochoidViewer_Setup Compression=lzma SolidCompression=yes WizardStyle=modern [Languages] Name: "japanese"; MessagesFile: "compiler:Languages\\Japanese.isl" [Tasks] Name: "desktopicon"; Description: "デスクトップにショートカットを作成"; GroupDescription: "追加のアイコン:" [Files] Source: "dist\\TrochoidViewer.exe"; DestDir: "{app}"; Flags: ignoreversion Source: "dist\\README.txt"; DestDir: "{app}"; Flags: ignoreversion [Icons] Name: "{group}\\{#MyAppName}"; Filename: "{app}\\{#MyAppExeName}" Name: "{group}\\README"; Filename: "{app}\\README.txt" Name: "{autodesktop}\\{#MyAppName}"; Filename: "{app}\\{#MyAppExeName}"; Tasks: desktopicon [Run] Filename: "{app}\\{#MyAppExeName}"; Description: "アプリケーションを起動"; Flags: nowait postinstall skipifsilent """
+    # 内容が同じなら書き込まず、更新日時を変えない（ISCC 側の再ビルドを避ける）
+    iss_path = Path("installer_script.iss")
+    if iss_path.exists() and iss_path.read_bytes() == script_bytes:
+        print("✓ installer_script.iss は最新です", file=sys.stderr)
+        return iss_path, digest
     
-    with open("installer_script.iss", 'w', encoding='utf-8') as f:
-        f.write(script_content)
+    # 一時ファイルに書いてから置き換え、書きかけのファイルが見えないようにする
+    tmp_path = iss_path.with_name(iss_path.name + ".tmp")
+    tmp_path.write_bytes(script_bytes)
+    tmp_path.replace(iss_path)
     
-    print("✓ installer_script.iss を作成しました")
-    print("\nInno Setup Compilerでこのファイルを開いてインストーラーを作成できます")
-    print("ダウンロード: https://jrsoftware.org/isdl.php")
+    # 案内はまとめて1回で stderr に出し、stdout は呼び出し側のために空けておく
+    print("\n".join([
+        "✓ installer_script.iss を作成しました",
+        "",
+        "Inno Setup Compilerでこのファイルを開いてインストーラーを作成できます",
+        "ダウンロード: https://jrsoftware.org/isdl.php",
+    ]), file=sys.stderr)
+    return iss_path, digest
 
 if __name__ == "__main__":
     create_inno_script()
\ No newline at end of file
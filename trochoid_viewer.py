@@ -1,52 +1,127 @@
+import os
 import sys
 import io
+import math
 import base64
 import platform
+import hashlib
+import functools
+import threading
+import time
+from pathlib import Path
 import numpy as np
 from PySide6.QtWidgets import (QApplication, QMainWindow, QWidget, QVBoxLayout, 
                                QHBoxLayout, QLabel, QComboBox, QSlider, 
                                QPushButton, QGroupBox, QTextEdit, QCheckBox, QTabWidget, QScrollArea)
-from PySide6.QtCore import Qt, QTimer
-from PySide6.QtGui import QFont
-from PySide6.QtSvgWidgets import QSvgWidget
-import matplotlib.pyplot as plt
+from PySide6.QtCore import Qt, QTimer, QByteArray
+from PySide6.QtGui import QFont, QImage, QPainter, QPixmap
+from PySide6.QtSvg import QSvgRenderer
+import matplotlib
 from matplotlib.backends.backend_qt5agg import FigureCanvasQTAgg as FigureCanvas
 from matplotlib.figure import Figure
 from matplotlib.backends.backend_agg import FigureCanvasAgg
 
-# OSに応じたフォント名を設定
-if platform.system() == 'Darwin':  # macOS
-    FONT_NAME = 'Hiragino Sans'
-elif platform.system() == 'Windows':
-    FONT_NAME = 'Meiryo'
-else:
-    FONT_NAME = 'sans-serif'
+# OSに応じたフォント名を設定（platform.system() は一度だけ呼ぶ）
+FONT_NAME = {
+    'Darwin': 'Hiragino Sans',  # macOS
+    'Windows': 'Meiryo',
+}.get(platform.system(), 'sans-serif')
 
-# matplotlib設定
-plt.rcParams['font.family'] = FONT_NAME
-plt.rcParams['mathtext.fontset'] = 'cm'
+# matplotlib設定（値が同じなら代入せず、フォントキャッシュの無効化を避ける）
+if matplotlib.rcParams['font.family'] != [FONT_NAME]:
+    matplotlib.rcParams['font.family'] = FONT_NAME
+if matplotlib.rcParams['mathtext.fontset'] != 'cm':
+    matplotlib.rcParams['mathtext.fontset'] = 'cm'
 
 # ---------------------------------------------------------
 # 数式画像を生成するヘルパー関数
 # ---------------------------------------------------------
-def latex_to_html(latex_str, fontsize=12):
-    try:
-        fig = Figure(figsize=(0.1, 0.1), dpi=120)
-        canvas = FigureCanvasAgg(fig)
+LATEX_CACHE_DIR = Path.home() / ".cache" / "trochoid-viewer"
+
+# 数式画像の解像度
+_LATEX_DPI = 120
+
+# 数式描画用の Figure/Canvas は作成コストが大きいので1組を使い回す
+_LATEX_FIG = Figure(figsize=(0.1, 0.1), dpi=_LATEX_DPI)
+_LATEX_CANVAS = FigureCanvasAgg(_LATEX_FIG)
+# 裏の事前描画スレッドと練習問題タブの両方から使うので、Figure の利用を排他する
+_LATEX_LOCK = threading.Lock()
+
+def _render_latex_b64(latex_str, fontsize):
+    with _LATEX_LOCK:
+        fig = _LATEX_FIG
+        canvas = _LATEX_CANVAS
+        fig.clear()
         text = fig.text(0, 0, f"${latex_str}$", fontsize=fontsize, va='bottom', ha='left')
         buf = io.BytesIO()
         canvas.draw()
         bbox = text.get_window_extent()
-        width = bbox.width / 120 + 0.1
-        height = bbox.height / 120 + 0.1
+        width = bbox.width / _LATEX_DPI + 0.1
+        height = bbox.height / _LATEX_DPI + 0.1
         fig.set_size_inches(width, height)
         text.set_position((0.05, 0.05))
-        fig.savefig(buf, format='png', transparent=True, bbox_inches='tight', pad_inches=0.05)
-        plt.close(fig)
-        data = base64.b64encode(buf.getvalue()).decode('utf-8')
-        return f'<img src="data:image/png;base64,{data}" style="vertical-align: middle;">'
-    except:
-        return f"<code>{latex_str}</code>"
+        # 小さな画像なので圧縮率より速さを優先する（PNG はどの圧縮レベルでも可逆）
+        fig.savefig(buf, format='png', transparent=True, bbox_inches='tight', pad_inches=0.05,
+                    pil_kwargs={'compress_level': 1})
+        return base64.b64encode(buf.getvalue()).decode('utf-8')
+
+def _latex_cache_file(latex_str, fontsize):
+    # 描画結果を左右する設定もキーに含め、matplotlib の更新やフォント変更後に古い画像を使わない
+    key_src = "\0".join((latex_str, str(fontsize), matplotlib.__version__, FONT_NAME,
+                         matplotlib.rcParams['mathtext.fontset'], str(_LATEX_DPI)))
+    key = hashlib.sha1(key_src.encode('utf-8')).hexdigest()
+    return LATEX_CACHE_DIR / f"{key}.b64"
+
+def _load_latex_cache(cache_file):
+    """キャッシュ済みの画像データを返す（無い・読めない・空のときは None）"""
+    try:
+        data = cache_file.read_text(encoding='ascii')
+    except (OSError, ValueError):
+        # 壊れたファイル（ASCII 以外を含む等）は描画し直して上書きする
+        return None
+    return data or None
+
+def _store_latex_cache(cache_file, data):
+    # 他のスレッドや同時に起動した別プロセスと重ならない一時ファイルに書いてから置き換える
+    tmp_file = cache_file.with_name(f"{cache_file.name}.{os.getpid()}.{threading.get_ident()}.tmp")
+    try:
+        LATEX_CACHE_DIR.mkdir(parents=True, exist_ok=True)
+        tmp_file.write_text(data, encoding='ascii')
+        os.replace(tmp_file, cache_file)
+    except OSError:
+        # 書きかけの一時ファイルを残さない（キャッシュは次回描画し直せばよい）
+        try:
+            tmp_file.unlink(missing_ok=True)
+        except OSError:
+            pass
+
+@functools.lru_cache(maxsize=None)
+def latex_to_html(latex_str, fontsize=12):
+    # 描画済みの画像はディスクにも保存し、次回起動時は読み込むだけにする
+    cache_file = _latex_cache_file(latex_str, fontsize)
+    data = _load_latex_cache(cache_file)
+    if data is None:
+        try:
+            data = _render_latex_b64(latex_str, fontsize)
+        except (RuntimeError, ValueError, KeyError):
+            # mathtext が解釈できない数式はそのまま表示する
+            return f"<code>{latex_str}</code>"
+        _store_latex_cache(cache_file, data)
+    return f'<img src="data:image/png;base64,{data}" style="vertical-align: middle;">'
+
+def _prerender_latex(items):
+    """ディスクキャッシュに無い数式を裏で1つずつ描画しておく
+    （spawn したワーカーは PySide6/matplotlib の読み込みだけで描画全体より時間がかかるので使わない）"""
+    for item in dict.fromkeys(items):
+        cache_file = _latex_cache_file(*item)
+        if _load_latex_cache(cache_file) is not None:
+            continue
+        try:
+            data = _render_latex_b64(*item)
+        except (RuntimeError, ValueError, KeyError):
+            # 解釈できない数式は latex_to_html がそのまま表示する
+            continue
+        _store_latex_cache(cache_file, data)
 
 # ---------------------------------------------------------
 # 曲線の定義データ（数式と説明を含む）
@@ -365,74 +440,152 @@ CLASSIFICATION_SVG = """
 </svg>
 """
 
+# QSvgRenderer に渡す UTF-8 バイト列はモジュール読み込み時に一度だけ作る
+CLASSIFICATION_SVG_BYTES = QByteArray(CLASSIFICATION_SVG.encode('utf-8'))
+
 # ---------------------------------------------------------
-# 数学ロジッククラス（元のまま）
+# 数学ロジッククラス
 # ---------------------------------------------------------
+def _cycloid(t, r, k, d, m=np):
+    return r * (t - m.sin(t)), r * (1 - m.cos(t))
+
+def _trochoid(t, r, k, d, m=np):
+    return r * t - d * m.sin(t), r - d * m.cos(t)
+
+def _cardioid(t, r, k, d, m=np):
+    # 2倍角の公式で cos 2t, sin 2t を cos t, sin t から求める
+    c, s = m.cos(t), m.sin(t)
+    return 2*r * c - r * (1 - 2*s*s), 2*r * s - r * (2*s*c)
+
+def _nephroid(t, r, k, d, m=np):
+    # b = r/2 の転がる円: (R + b) = 1.5r, (R + b) / b = 3
+    a, b = 1.5 * r, 0.5 * r
+    angle = 3.0 * t
+    return a * m.cos(t) - b * m.cos(angle), a * m.sin(t) - b * m.sin(angle)
+
+def _astroid(t, r, k, d, m=np):
+    # ** 3 は汎用の pow になるため掛け算で3乗する
+    c, s = m.cos(t), m.sin(t)
+    return r * (c * c * c), r * (s * s * s)
+
+def _epicycloid(t, r, k, d, m=np):
+    r_small = r / k if k != 0 else 1
+    dist = r + r_small
+    angle = (dist / r_small) * t
+    return (dist * m.cos(t) - r_small * m.cos(angle),
+            dist * m.sin(t) - r_small * m.sin(angle))
+
+def _epitrochoid(t, r, k, d, m=np):
+    r_small = r / k if k != 0 else 1
+    dist = r + r_small
+    angle = (dist / r_small) * t
+    return (dist * m.cos(t) - d * m.cos(angle),
+            dist * m.sin(t) - d * m.sin(angle))
+
+def _hypocycloid(t, r, k, d, m=np):
+    r_small = r / k if k != 0 else 1
+    dist = r - r_small
+    angle = (dist / r_small) * t
+    return (dist * m.cos(t) + r_small * m.cos(angle),
+            dist * m.sin(t) - r_small * m.sin(angle))
+
+def _hypotrochoid(t, r, k, d, m=np):
+    r_small = r / k if k != 0 else 1
+    dist = r - r_small
+    angle = (dist / r_small) * t
+    return (dist * m.cos(t) + d * m.cos(angle),
+            dist * m.sin(t) - d * m.sin(angle))
+
+def _lissajous(t, r, k, d, m=np):
+    freq_a = k
+    freq_b = 3
+    delta = d
+    return r * m.sin(freq_a * t + delta), r * m.sin(freq_b * t)
+
+def _rose(t, r, k, d, m=np):
+    rad = r * m.cos(k * t)
+    return rad * m.cos(t), rad * m.sin(t)
+
+# 曲線名 → 座標計算関数（文字列比較の連鎖を辞書引き1回にする）
+_CURVE_FUNCS = {
+    "cycloid": _cycloid,
+    "trochoid": _trochoid,
+    "cardioid": _cardioid,
+    "nephroid": _nephroid,
+    "astroid": _astroid,
+    "epicycloid": _epicycloid,
+    "epitrochoid": _epitrochoid,
+    "hypocycloid": _hypocycloid,
+    "hypotrochoid": _hypotrochoid,
+    "lissajous": _lissajous,
+    "rose": _rose,
+}
+
+# 閉じた式で求まる曲線の長さ（t ∈ [0, max_t] を曲線に沿って測った長さ）
+#   サイクロイド: 1アーチ ∫0^2π 2r|sin(t/2)| dt = 8r → 4r·max_t/π
+#   エピ/ハイポサイクロイド: 1アーチ 8r'(R ± r')/R、アーチ数 R·max_t/(2πr') → 4(R ± r')·max_t/π
+#     （アーチがちょうど閉じる整数 k のときだけ成り立つ。それ以外は求積に任せる）
+#   カージオイド 16r、ネフロイド 24·(r/2) = 12r、アステロイド 6r（いずれも1周）
+_CLOSED_FORM_LENGTHS = {
+    "cycloid": lambda r, k, max_t: 4 * r * max_t / math.pi,
+    "cardioid": lambda r, k, max_t: 16 * r,
+    "nephroid": lambda r, k, max_t: 12 * r,
+    "astroid": lambda r, k, max_t: 6 * r,
+    "epicycloid": lambda r, k, max_t: 4 * (r + r / k) * max_t / math.pi,
+    "hypocycloid": lambda r, k, max_t: 4 * abs(r - r / k) * max_t / math.pi,
+}
+_INTEGER_K_LENGTHS = ("epicycloid", "hypocycloid")
+
+# 閉じた式で求まる面積（1周で閉じる単純閉曲線のみ）
+#   カージオイド 6πr²、ネフロイド 12π(r/2)² = 3πr²、アステロイド 3πr²/8
+_CLOSED_FORM_AREAS = {
+    "cardioid": lambda r: 6 * math.pi * r * r,
+    "nephroid": lambda r: 3 * math.pi * r * r,
+    "astroid": lambda r: 3 * math.pi * r * r / 8,
+}
+
+# 8点 Gauss-Legendre 求積の節点と重み（区間 [-1, 1]）
+_GL_NODES, _GL_WEIGHTS = np.polynomial.legendre.leggauss(8)
+
+def _gauss_legendre_nodes(a, b, n_segments):
+    """[a, b] を n_segments 等分した各区間の求積節点と重みを1次元配列で返す"""
+    edges = np.linspace(a, b, n_segments + 1)
+    half = 0.5 * np.diff(edges)[:, None]
+    mid = 0.5 * (edges[:-1] + edges[1:])[:, None]
+    return (mid + half * _GL_NODES).ravel(), (half * _GL_WEIGHTS).ravel()
+
+def _curve_with_derivative(fn, t, r, k, d):
+    """曲線の座標と t による微分を返す（複素ステップ微分で、丸め誤差なしに導関数を得る）"""
+    h = 1e-20
+    x, y = fn(t + 1j * h, r, k, d)
+    return x.real, y.real, x.imag / h, y.imag / h
+
+# 補助円の描画に使う単位円（毎フレーム三角関数を計算しないよう定数として保持）
+_CIRCLE_THETA = np.linspace(0, 2*np.pi, 100)
+_CIRCLE_COS = np.cos(_CIRCLE_THETA)
+_CIRCLE_SIN = np.sin(_CIRCLE_THETA)
+
+# 軌跡のサンプル密度（t 1ラジアンあたりの点数）
+SAMPLES_PER_RAD = 50
+
 class CurveMath:
     @staticmethod
     def get_point(curve_type, t, r, k, d):
-        x, y = 0, 0
-        
-        if curve_type == "cycloid":
-            x = r * (t - np.sin(t))
-            y = r * (1 - np.cos(t))
-        elif curve_type == "trochoid":
-            x = r * t - d * np.sin(t)
-            y = r - d * np.cos(t)
-        elif curve_type == "cardioid":
-            x = 2*r * np.cos(t) - r * np.cos(2*t)
-            y = 2*r * np.sin(t) - r * np.sin(2*t)
-        elif curve_type == "nephroid":
-            R = r
-            b = r / 2.0
-            x = (R + b) * np.cos(t) - b * np.cos((R + b) / b * t)
-            y = (R + b) * np.sin(t) - b * np.sin((R + b) / b * t)
-        elif curve_type == "astroid":
-            x = r * (np.cos(t) ** 3)
-            y = r * (np.sin(t) ** 3)
-        elif curve_type == "epicycloid":
-            R = r
-            r_small = r / k if k != 0 else 1
-            x = (R + r_small) * np.cos(t) - r_small * np.cos((R + r_small) / r_small * t)
-            y = (R + r_small) * np.sin(t) - r_small * np.sin((R + r_small) / r_small * t)
-        elif curve_type == "epitrochoid":
-            R = r
-            r_small = r / k if k != 0 else 1
-            x = (R + r_small) * np.cos(t) - d * np.cos((R + r_small) / r_small * t)
-            y = (R + r_small) * np.sin(t) - d * np.sin((R + r_small) / r_small * t)
-        elif curve_type == "hypocycloid":
-            R = r
-            r_small = r / k if k != 0 else 1
-            x = (R - r_small) * np.cos(t) + r_small * np.cos((R - r_small) / r_small * t)
-            y = (R - r_small) * np.sin(t) - r_small * np.sin((R - r_small) / r_small * t)
-        elif curve_type == "hypotrochoid":
-            R = r
-            r_small = r / k if k != 0 else 1
-            x = (R - r_small) * np.cos(t) + d * np.cos((R - r_small) / r_small * t)
-            y = (R - r_small) * np.sin(t) - d * np.sin((R - r_small) / r_small * t)
-        elif curve_type == "lissajous":
-            freq_a = k
-            freq_b = 3 
-            delta = d 
-            x = r * np.sin(freq_a * t + delta)
-            y = r * np.sin(freq_b * t)
-        elif curve_type == "rose":
-            rad = r * np.cos(k * t)
-            x = rad * np.cos(t)
-            y = rad * np.sin(t)
-            
-        return x, y
+        fn = _CURVE_FUNCS.get(curve_type)
+        if fn is None:
+            return 0, 0
+        # スカラーの t では numpy より math の方が呼び出しコストが小さい
+        m = math if isinstance(t, (int, float)) else np
+        return fn(t, r, k, d, m)
 
     @staticmethod
     def get_auxiliary_data(curve_type, t, r, k, d):
-        theta = np.linspace(0, 2*np.pi, 100)
-        
         if curve_type in ["cycloid", "trochoid"]:
             fixed_x = np.linspace(-r, r * 4 * np.pi + r, 100)
             fixed_y = np.zeros_like(fixed_x)
             cx, cy = r * t, r
-            roll_x = cx + r * np.cos(theta)
-            roll_y = cy + r * np.sin(theta)
+            roll_x = cx + r * _CIRCLE_COS
+            roll_y = cy + r * _CIRCLE_SIN
             return (fixed_x, fixed_y), (roll_x, roll_y), (cx, cy)
         elif curve_type in ["epicycloid", "cardioid", "nephroid", "epitrochoid"]:
             R = r
@@ -442,13 +595,13 @@ class CurveMath:
                 r_small = r / 2.0
             else:
                 r_small = r / k
-            fixed_x = R * np.cos(theta)
-            fixed_y = R * np.sin(theta)
+            fixed_x = R * _CIRCLE_COS
+            fixed_y = R * _CIRCLE_SIN
             dist = R + r_small
-            cx = dist * np.cos(t)
-            cy = dist * np.sin(t)
-            roll_x = cx + r_small * np.cos(theta)
-            roll_y = cy + r_small * np.sin(theta)
+            cx = dist * math.cos(t)
+            cy = dist * math.sin(t)
+            roll_x = cx + r_small * _CIRCLE_COS
+            roll_y = cy + r_small * _CIRCLE_SIN
             return (fixed_x, fixed_y), (roll_x, roll_y), (cx, cy)
         elif curve_type in ["hypocycloid", "astroid", "hypotrochoid"]:
             R = r
@@ -456,16 +609,52 @@ class CurveMath:
                 r_small = r / 4.0
             else:
                 r_small = r / k
-            fixed_x = R * np.cos(theta)
-            fixed_y = R * np.sin(theta)
+            fixed_x = R * _CIRCLE_COS
+            fixed_y = R * _CIRCLE_SIN
             dist = R - r_small
-            cx = dist * np.cos(t)
-            cy = dist * np.sin(t)
-            roll_x = cx + r_small * np.cos(theta)
-            roll_y = cy + r_small * np.sin(theta)
+            cx = dist * math.cos(t)
+            cy = dist * math.sin(t)
+            roll_x = cx + r_small * _CIRCLE_COS
+            roll_y = cy + r_small * _CIRCLE_SIN
             return (fixed_x, fixed_y), (roll_x, roll_y), (cx, cy)
         return None, None, None
 
+    @staticmethod
+    def get_bounds(curve_type, r, k, d):
+        """軌跡と補助円をすべて含む範囲 (xmin, xmax, ymin, ymax) を式から求める"""
+        if curve_type in ["cycloid", "trochoid"]:
+            # 固定線は -r〜4πr+r、転がる円は 0〜2r、追跡点は中心から d まで離れる
+            reach = max(r, d) if curve_type == "trochoid" else r
+            return -reach, 4 * np.pi * r + reach, min(0, r - reach), max(2 * r, r + reach)
+        r_small = r / k if k != 0 else 1
+        if curve_type == "cardioid":
+            extent = 3 * r
+        elif curve_type == "nephroid":
+            extent = 2 * r
+        elif curve_type == "epicycloid":
+            extent = r + 2 * r_small
+        elif curve_type == "epitrochoid":
+            extent = r + r_small + max(r_small, d)
+        elif curve_type == "astroid":
+            extent = r
+        elif curve_type == "hypocycloid":
+            extent = max(r, abs(r - r_small) + r_small)
+        elif curve_type == "hypotrochoid":
+            extent = max(r, abs(r - r_small) + max(r_small, d))
+        else:
+            # リサージュ曲線・正葉曲線は半径 r の範囲に収まる
+            extent = r
+        return -extent, extent, -extent, extent
+
+    @staticmethod
+    def get_period(curve_type, k):
+        """曲線が閉じて同じ軌跡をなぞり始めるまでの t の長さ（閉じない曲線は None）"""
+        if curve_type in ["cycloid", "trochoid"]:
+            return None
+        if curve_type in ["cardioid", "nephroid", "astroid"] or float(k).is_integer():
+            return 2 * np.pi
+        return None
+
     @staticmethod
     def get_max_t(curve_type, k):
         if curve_type in ["cycloid", "trochoid"]: 
@@ -476,285 +665,301 @@ class CurveMath:
             return 2 * np.pi if k % 2 != 0 else 2 * np.pi 
         return 2 * np.pi
 
+    # 長さ・面積は t によらないため、パラメータの組ごとに一度だけ計算する
     @staticmethod
+    @functools.lru_cache(maxsize=256)
     def calculate_stats(curve_type, r, k, d, max_t):
-        steps = 1000
-        t_vals = np.linspace(0, max_t, steps)
-        xs = []
-        ys = []
-        for t in t_vals:
-            x, y = CurveMath.get_point(curve_type, t, r, k, d)
-            xs.append(x)
-            ys.append(y)
-        xs = np.array(xs)
-        ys = np.array(ys)
-        dx = np.diff(xs)
-        dy = np.diff(ys)
-        length = np.sum(np.sqrt(dx**2 + dy**2))
-        area = 0.5 * np.abs(np.sum(xs[:-1] * ys[1:] - xs[1:] * ys[:-1]))
+        length_fn = _CLOSED_FORM_LENGTHS.get(curve_type)
+        if curve_type in _INTEGER_K_LENGTHS and not (float(k).is_integer() and k > 0):
+            length_fn = None
+        area_fn = _CLOSED_FORM_AREAS.get(curve_type)
+        if length_fn is not None and area_fn is not None:
+            return length_fn(r, k, max_t), area_fn(r)
+        # 閉じた式がなければ Gauss-Legendre 求積で積分する
+        #   L = ∫|(x', y')| dt,  S = |1/2 ∫(x y' - y x') dt|（グリーンの定理）
+        fn = _CURVE_FUNCS[curve_type]
+        t_vals, weights = _gauss_legendre_nodes(0, max_t, 64)
+        xs, ys, dxs, dys = _curve_with_derivative(fn, t_vals, r, k, d)
+        if length_fn is not None:
+            length = length_fn(r, k, max_t)
+        else:
+            length = np.dot(weights, np.hypot(dxs, dys))
+        area = 0.5 * abs(np.dot(weights, xs * dys - ys * dxs))
         return length, area
 
 # ---------------------------------------------------------
-# 練習問題データ（元のまま）
+# 練習問題データ
 # ---------------------------------------------------------
-print("数式画像を生成中...お待ちください...")
-
-EXERCISE_DATA = {
-    0: {
-        "title": "【第1問】サイクロイドの長さ（基本）",
-        "question": """
-            <p>次の媒介変数表示された曲線の長さ {} を求めよ。</p>
-            <div align='center'>
-            {}<br>{}<br>{}
-            </div>
-        """.format(
-            latex_to_html("L"),
-            latex_to_html(r"x = r(t - \sin t)"),
-            latex_to_html(r"y = r(1 - \cos t)"),
-            latex_to_html(r"(0 \leqq t \leqq 2\pi, \ r > 0)")
-        ),
-        "answer": """
-            <p><b>【解答】</b></p>
-            <p>まず微分を計算します。</p>
-            <div align='center'>
-            {}
-            </div>
-            <p>ルートの中身を計算して整理します。</p>
-            <div align='center'>
-            {}<br>{}<br>{}
-            </div>
-            <p>半角の公式 {} を利用します。</p>
-            <div align='center'>
-            {}
-            </div>
-            <p>よって、積分を実行します（{} で {}）。</p>
-            <div align='center'>
-            {}<br>{}<br>{}<br>{}
-            </div>
-            <p><b>答：{}</b></p>
-        """.format(
-            latex_to_html(r"\frac{dx}{dt} = r(1 - \cos t), \quad \frac{dy}{dt} = r \sin t"),
-            latex_to_html(r"\left(\frac{dx}{dt}\right)^2 + \left(\frac{dy}{dt}\right)^2 = r^2(1 - \cos t)^2 + r^2 \sin^2 t"),
-            latex_to_html(r"= r^2(1 - 2\cos t + \cos^2 t + \sin^2 t)"),
-            latex_to_html(r"= 2r^2(1 - \cos t)"),
-            latex_to_html(r"1 - \cos t = 2\sin^2 \frac{t}{2}"),
-            latex_to_html(r"= 4r^2 \sin^2 \frac{t}{2}"),
-            latex_to_html(r"0 \leqq t \leqq 2\pi"),
-            latex_to_html(r"\sin \frac{t}{2} \geqq 0"),
-            latex_to_html(r"L = \int_{0}^{2\pi} 2r \sin \frac{t}{2} dt"),
-            latex_to_html(r"= 2r \left[ -2\cos \frac{t}{2} \right]_{0}^{2\pi}"),
-            latex_to_html(r"= -4r (\cos \pi - \cos 0)"),
-            latex_to_html(r"= -4r (-1 - 1)"),
-            latex_to_html(r"L = 8r")
-        )
-    },
-    1: {
-        "title": "【第2問】アステロイドの長さ（標準）",
-        "question": """
-            <p>次の媒介変数表示された曲線の長さ {} を求めよ。</p>
-            <div align='center'>
-            {}<br>{}<br>{}
-            </div>
-        """.format(
-            latex_to_html("L"),
-            latex_to_html(r"x = a \cos^3 t"),
-            latex_to_html(r"y = a \sin^3 t"),
-            latex_to_html(r"(0 \leqq t \leqq 2\pi, \ a > 0)")
-        ),
-        "answer": """
-            <p><b>【解答】</b></p>
-            <p>微分を計算します。</p>
-            <div align='center'>
-            {}<br>{}
-            </div>
-            <p>ルートの中身を計算します。</p>
-            <div align='center'>
-            {}<br>{}<br>{}
-            </div>
-            <p>対称性を利用し、第一象限 {} を4倍します。</p>
-            <div align='center'>
-            {}<br>{}<br>{}<br>{}
-            </div>
-            <p><b>答：{}</b></p>
-        """.format(
-            latex_to_html(r"\frac{dx}{dt} = -3a \cos^2 t \sin t"),
-            latex_to_html(r"\frac{dy}{dt} = 3a \sin^2 t \cos t"),
-            latex_to_html(r"\left(\frac{dx}{dt}\right)^2 + \left(\frac{dy}{dt}\right)^2 = 9a^2 \cos^4 t \sin^2 t + 9a^2 \sin^4 t \cos^2 t"),
-            latex_to_html(r"= 9a^2 \sin^2 t \cos^2 t"),
-            latex_to_html(r"= \frac{9}{4}a^2 \sin^2 2t"),
-            latex_to_html(r"(0 \leqq t \leqq \frac{\pi}{2})"),
-            latex_to_html(r"L = 4 \int_{0}^{\frac{\pi}{2}} \frac{3}{2}a \sin 2t dt"),
-            latex_to_html(r"= 6a \int_{0}^{\frac{\pi}{2}} \sin 2t dt"),
-            latex_to_html(r"= 6a \left[ -\frac{1}{2} \cos 2t \right]_{0}^{\frac{\pi}{2}}"),
-            latex_to_html(r"= -3a(\cos \pi - \cos 0)"),
-            latex_to_html(r"L = 6a")
-        )
-    },
-    2: {
-        "title": "【第3問】カージオイドの長さ（応用）",
-        "question": """
-            <p>次の媒介変数表示された曲線の長さ {} を求めよ。</p>
-            <div align='center'>
-            {}<br>{}<br>{}
-            </div>
-        """.format(
-            latex_to_html("L"),
-            latex_to_html(r"x = 2r \cos t - r \cos 2t"),
-            latex_to_html(r"y = 2r \sin t - r \sin 2t"),
-            latex_to_html(r"(0 \leqq t \leqq 2\pi, \ r > 0)")
-        ),
-        "answer": """
-            <p><b>【解答】</b></p>
-            <p>微分を計算します。</p>
-            <div align='center'>
-            {}<br>{}
-            </div>
-            <p>ルートの中身を計算します（加法定理 {} を使用）。</p>
-            <div align='center'>
-            {}<br>{}<br>{}<br>{}
-            </div>
-            <p>半角の公式 {} を利用します。</p>
-            <div align='center'>
-            {}
-            </div>
-            <p>積分を実行します。</p>
-            <div align='center'>
-            {}<br>{}<br>{}
-            </div>
-            <p><b>答：{}</b></p>
-        """.format(
-            latex_to_html(r"\frac{dx}{dt} = -2r \sin t + 2r \sin 2t"),
-            latex_to_html(r"\frac{dy}{dt} = 2r \cos t - 2r \cos 2t"),
-            latex_to_html(r"\cos(A-B)"),
-            latex_to_html(r"\left(\frac{dx}{dt}\right)^2 + \left(\frac{dy}{dt}\right)^2"),
-            latex_to_html(r"= 4r^2(\sin^2 t - 2\sin t \sin 2t + \sin^2 2t)"),
-            latex_to_html(r"+ 4r^2(\cos^2 t - 2\cos t \cos 2t + \cos^2 2t)"),
-            latex_to_html(r"= 8r^2(1 - \cos t)"),
-            latex_to_html(r"1 - \cos t = 2\sin^2 \frac{t}{2}"),
-            latex_to_html(r"= 16r^2 \sin^2 \frac{t}{2}"),
-            latex_to_html(r"L = \int_{0}^{2\pi} 4r \sin \frac{t}{2} dt"),
-            latex_to_html(r"= 4r \left[ -2\cos \frac{t}{2} \right]_{0}^{2\pi}"),
-            latex_to_html(r"= -8r(-1-1)"),
-            latex_to_html(r"L = 16r")
-        )
-    },
-    3: {
-        "title": "【第4問】ネフロイドの長さ（発展）",
-        "question": """
-            <p>次の媒介変数表示された曲線の長さ {} を求めよ。</p>
-            <div align='center'>
-            {}<br>{}<br>{}
-            </div>
-        """.format(
-            latex_to_html("L"),
-            latex_to_html(r"x = 3a \cos t - a \cos 3t"),
-            latex_to_html(r"y = 3a \sin t - a \sin 3t"),
-            latex_to_html(r"(0 \leqq t \leqq 2\pi, \ a > 0)")
-        ),
-        "answer": """
-            <p><b>【解答】</b></p>
-            <p>微分を計算します。</p>
-            <div align='center'>
-            {}<br>{}
-            </div>
-            <p>ルートの中身を整理します（加法定理を使用）。</p>
-            <div align='center'>
-            {}<br>{}<br>{}
-            </div>
-            <p>半角の公式 {} を利用します。</p>
-            <div align='center'>
-            {}
-            </div>
-            <p>絶対値に注意して積分します（{} を2倍）。</p>
-            <div align='center'>
-            {}<br>{}<br>{}<br>{}
-            </div>
-            <p><b>答：{}</b></p>
-        """.format(
-            latex_to_html(r"\frac{dx}{dt} = -3a \sin t + 3a \sin 3t"),
-            latex_to_html(r"\frac{dy}{dt} = 3a \cos t - 3a \cos 3t"),
-            latex_to_html(r"\left(\frac{dx}{dt}\right)^2 + \left(\frac{dy}{dt}\right)^2"),
-            latex_to_html(r"= 9a^2(2 - 2(\cos 3t \cos t + \sin 3t \sin t))"),
-            latex_to_html(r"= 18a^2(1 - \cos 2t)"),
-            latex_to_html(r"1 - \cos 2t = 2\sin^2 t"),
-            latex_to_html(r"= 36a^2 \sin^2 t"),
-            latex_to_html(r"0 \leqq t \leqq \pi"),
-            latex_to_html(r"L = 2 \int_{0}^{\pi} 6a \sin t dt"),
-            latex_to_html(r"= 12a \left[ -\cos t \right]_{0}^{\pi}"),
-            latex_to_html(r"= -12a(-1-1)"),
-            latex_to_html(r"= 24a"),
-            latex_to_html(r"L = 24a")
-        )
-    },
-    4: {
-        "title": "【第5問】トロコイドの性質（理論）",
-        "question": """
-            <p>半径 {} の円が直線上を転がるとき、円の中心から距離 {} の点が描く曲線（トロコイド）について考える。</p>
-            <p>(1) {} のとき、曲線はどのような特徴を持つか説明せよ。</p>
-            <p>(2) {} のとき、曲線はどのような特徴を持つか説明せよ。</p>
-        """.format(
-            latex_to_html("r"),
-            latex_to_html("d"),
-            latex_to_html("d = r"),
-            latex_to_html("d > r")
-        ),
-        "answer": """
-            <p><b>【解答】</b></p>
-            <p><b>(1) {} の場合：</b></p>
-            <p>これは通常のサイクロイドになります。曲線は尖点（カスプ）を持ち、最速降下線の性質を持ちます。</p>
-            <p><b>(2) {} の場合：</b></p>
-            <p>曲線は波打つ形状になり、ループを持ちます。追跡点が円周より外側にあるため、円が転がるときに一時的に後退する動きが生じ、これがループを形成します。</p>
-            <p>一般に、トロコイドの媒介変数表示は：</p>
-            <div align='center'>
-            {}<br>{}
-            </div>
-            <p>で与えられます。{} のとき、曲線は {} 軸と交差します。</p>
-        """.format(
-            latex_to_html("d = r"),
-            latex_to_html("d > r"),
-            latex_to_html(r"x = rt - d\sin t"),
-            latex_to_html(r"y = r - d\cos t"),
-            latex_to_html("d > r"),
-            latex_to_html("x")
-        )
-    },
-    5: {
-        "title": "【第6問】ハイポサイクロイドの特殊例（挑戦）",
-        "question": """
-            <p>半径 {} の固定円の内側を、半径 {} の円が転がるとき、転がる円周上の点が描く曲線について：</p>
-            <p>(1) {} のとき、曲線の名称と特徴を述べよ。</p>
-            <p>(2) {} のとき、曲線の名称を述べよ。</p>
-            <p>(3) 一般に {} のとき、曲線は何個の尖点を持つか答えよ。</p>
-        """.format(
-            latex_to_html("R"),
-            latex_to_html("r"),
-            latex_to_html("R = 4r"),
-            latex_to_html("R = 3r"),
-            latex_to_html("R = kr")
-        ),
-        "answer": """
-            <p><b>【解答】</b></p>
-            <p><b>(1) {} の場合：</b></p>
-            <p>これはアステロイド（星形）と呼ばれる曲線です。4つの尖点を持ち、方程式は：</p>
-            <div align='center'>
-            {}<br>{}
-            </div>
-            <p>または {} で表されます。</p>
-            <p><b>(2) {} の場合：</b></p>
-            <p>これはデルトイド（三角形風）と呼ばれる曲線です。3つの尖点を持ちます。</p>
-            <p><b>(3) 一般の場合：</b></p>
-            <p>ハイポサイクロイドは {} 個の尖点を持ちます。これは転がる円が固定円の内側を {} 周して元の位置に戻るためです。</p>
-        """.format(
-            latex_to_html("R = 4r"),
-            latex_to_html(r"x = a\cos^3 t"),
-            latex_to_html(r"y = a\sin^3 t"),
-            latex_to_html(r"x^{2/3} + y^{2/3} = a^{2/3}"),
-            latex_to_html("R = 3r"),
-            latex_to_html("k"),
-            latex_to_html("k")
-        )
+def _build_exercise_data(tex):
+    """練習問題データを構築（tex は数式を HTML に変換する関数）"""
+    return {
+        0: {
+            "title": "【第1問】サイクロイドの長さ（基本）",
+            "question": """
+                <p>次の媒介変数表示された曲線の長さ {} を求めよ。</p>
+                <div align='center'>
+                {}<br>{}<br>{}
+                </div>
+            """.format(
+                tex("L"),
+                tex(r"x = r(t - \sin t)"),
+                tex(r"y = r(1 - \cos t)"),
+                tex(r"(0 \leqq t \leqq 2\pi, \ r > 0)")
+            ),
+            "answer": """
+                <p><b>【解答】</b></p>
+                <p>まず微分を計算します。</p>
+                <div align='center'>
+                {}
+                </div>
+                <p>ルートの中身を計算して整理します。</p>
+                <div align='center'>
+                {}<br>{}<br>{}
+                </div>
+                <p>半角の公式 {} を利用します。</p>
+                <div align='center'>
+                {}
+                </div>
+                <p>よって、積分を実行します（{} で {}）。</p>
+                <div align='center'>
+                {}<br>{}<br>{}<br>{}
+                </div>
+                <p><b>答：{}</b></p>
+            """.format(
+                tex(r"\frac{dx}{dt} = r(1 - \cos t), \quad \frac{dy}{dt} = r \sin t"),
+                tex(r"\left(\frac{dx}{dt}\right)^2 + \left(\frac{dy}{dt}\right)^2 = r^2(1 - \cos t)^2 + r^2 \sin^2 t"),
+                tex(r"= r^2(1 - 2\cos t + \cos^2 t + \sin^2 t)"),
+                tex(r"= 2r^2(1 - \cos t)"),
+                tex(r"1 - \cos t = 2\sin^2 \frac{t}{2}"),
+                tex(r"= 4r^2 \sin^2 \frac{t}{2}"),
+                tex(r"0 \leqq t \leqq 2\pi"),
+                tex(r"\sin \frac{t}{2} \geqq 0"),
+                tex(r"L = \int_{0}^{2\pi} 2r \sin \frac{t}{2} dt"),
+                tex(r"= 2r \left[ -2\cos \frac{t}{2} \right]_{0}^{2\pi}"),
+                tex(r"= -4r (\cos \pi - \cos 0)"),
+                tex(r"= -4r (-1 - 1)"),
+                tex(r"L = 8r")
+            )
+        },
+        1: {
+            "title": "【第2問】アステロイドの長さ（標準）",
+            "question": """
+                <p>次の媒介変数表示された曲線の長さ {} を求めよ。</p>
+                <div align='center'>
+                {}<br>{}<br>{}
+                </div>
+            """.format(
+                tex("L"),
+                tex(r"x = a \cos^3 t"),
+                tex(r"y = a \sin^3 t"),
+                tex(r"(0 \leqq t \leqq 2\pi, \ a > 0)")
+            ),
+            "answer": """
+                <p><b>【解答】</b></p>
+                <p>微分を計算します。</p>
+                <div align='center'>
+                {}<br>{}
+                </div>
+                <p>ルートの中身を計算します。</p>
+                <div align='center'>
+                {}<br>{}<br>{}
+                </div>
+                <p>対称性を利用し、第一象限 {} を4倍します。</p>
+                <div align='center'>
+                {}<br>{}<br>{}<br>{}
+                </div>
+                <p><b>答：{}</b></p>
+            """.format(
+                tex(r"\frac{dx}{dt} = -3a \cos^2 t \sin t"),
+                tex(r"\frac{dy}{dt} = 3a \sin^2 t \cos t"),
+                tex(r"\left(\frac{dx}{dt}\right)^2 + \left(\frac{dy}{dt}\right)^2 = 9a^2 \cos^4 t \sin^2 t + 9a^2 \sin^4 t \cos^2 t"),
+                tex(r"= 9a^2 \sin^2 t \cos^2 t"),
+                tex(r"= \frac{9}{4}a^2 \sin^2 2t"),
+                tex(r"(0 \leqq t \leqq \frac{\pi}{2})"),
+                tex(r"L = 4 \int_{0}^{\frac{\pi}{2}} \frac{3}{2}a \sin 2t dt"),
+                tex(r"= 6a \int_{0}^{\frac{\pi}{2}} \sin 2t dt"),
+                tex(r"= 6a \left[ -\frac{1}{2} \cos 2t \right]_{0}^{\frac{\pi}{2}}"),
+                tex(r"= -3a(\cos \pi - \cos 0)"),
+                tex(r"L = 6a")
+            )
+        },
+        2: {
+            "title": "【第3問】カージオイドの長さ（応用）",
+            "question": """
+                <p>次の媒介変数表示された曲線の長さ {} を求めよ。</p>
+                <div align='center'>
+                {}<br>{}<br>{}
+                </div>
+            """.format(
+                tex("L"),
+                tex(r"x = 2r \cos t - r \cos 2t"),
+                tex(r"y = 2r \sin t - r \sin 2t"),
+                tex(r"(0 \leqq t \leqq 2\pi, \ r > 0)")
+            ),
+            "answer": """
+                <p><b>【解答】</b></p>
+                <p>微分を計算します。</p>
+                <div align='center'>
+                {}<br>{}
+                </div>
+                <p>ルートの中身を計算します（加法定理 {} を使用）。</p>
+                <div align='center'>
+                {}<br>{}<br>{}<br>{}
+                </div>
+                <p>半角の公式 {} を利用します。</p>
+                <div align='center'>
+                {}
+                </div>
+                <p>積分を実行します。</p>
+                <div align='center'>
+                {}<br>{}<br>{}
+                </div>
+                <p><b>答：{}</b></p>
+            """.format(
+                tex(r"\frac{dx}{dt} = -2r \sin t + 2r \sin 2t"),
+                tex(r"\frac{dy}{dt} = 2r \cos t - 2r \cos 2t"),
+                tex(r"\cos(A-B)"),
+                tex(r"\left(\frac{dx}{dt}\right)^2 + \left(\frac{dy}{dt}\right)^2"),
+                tex(r"= 4r^2(\sin^2 t - 2\sin t \sin 2t + \sin^2 2t)"),
+                tex(r"+ 4r^2(\cos^2 t - 2\cos t \cos 2t + \cos^2 2t)"),
+                tex(r"= 8r^2(1 - \cos t)"),
+                tex(r"1 - \cos t = 2\sin^2 \frac{t}{2}"),
+                tex(r"= 16r^2 \sin^2 \frac{t}{2}"),
+                tex(r"L = \int_{0}^{2\pi} 4r \sin \frac{t}{2} dt"),
+                tex(r"= 4r \left[ -2\cos \frac{t}{2} \right]_{0}^{2\pi}"),
+                tex(r"= -8r(-1-1)"),
+                tex(r"L = 16r")
+            )
+        },
+        3: {
+            "title": "【第4問】ネフロイドの長さ（発展）",
+            "question": """
+                <p>次の媒介変数表示された曲線の長さ {} を求めよ。</p>
+                <div align='center'>
+                {}<br>{}<br>{}
+                </div>
+            """.format(
+                tex("L"),
+                tex(r"x = 3a \cos t - a \cos 3t"),
+                tex(r"y = 3a \sin t - a \sin 3t"),
+                tex(r"(0 \leqq t \leqq 2\pi, \ a > 0)")
+            ),
+            "answer": """
+                <p><b>【解答】</b></p>
+                <p>微分を計算します。</p>
+                <div align='center'>
+                {}<br>{}
+                </div>
+                <p>ルートの中身を整理します（加法定理を使用）。</p>
+                <div align='center'>
+                {}<br>{}<br>{}
+                </div>
+                <p>半角の公式 {} を利用します。</p>
+                <div align='center'>
+                {}
+                </div>
+                <p>絶対値に注意して積分します（{} を2倍）。</p>
+                <div align='center'>
+                {}<br>{}<br>{}<br>{}
+                </div>
+                <p><b>答：{}</b></p>
+            """.format(
+                tex(r"\frac{dx}{dt} = -3a \sin t + 3a \sin 3t"),
+                tex(r"\frac{dy}{dt} = 3a \cos t - 3a \cos 3t"),
+                tex(r"\left(\frac{dx}{dt}\right)^2 + \left(\frac{dy}{dt}\right)^2"),
+                tex(r"= 9a^2(2 - 2(\cos 3t \cos t + \sin 3t \sin t))"),
+                tex(r"= 18a^2(1 - \cos 2t)"),
+                tex(r"1 - \cos 2t = 2\sin^2 t"),
+                tex(r"= 36a^2 \sin^2 t"),
+                tex(r"0 \leqq t \leqq \pi"),
+                tex(r"L = 2 \int_{0}^{\pi} 6a \sin t dt"),
+                tex(r"= 12a \left[ -\cos t \right]_{0}^{\pi}"),
+                tex(r"= -12a(-1-1)"),
+                tex(r"= 24a"),
+                tex(r"L = 24a")
+            )
+        },
+        4: {
+            "title": "【第5問】トロコイドの性質（理論）",
+            "question": """
+                <p>半径 {} の円が直線上を転がるとき、円の中心から距離 {} の点が描く曲線（トロコイド）について考える。</p>
+                <p>(1) {} のとき、曲線はどのような特徴を持つか説明せよ。</p>
+                <p>(2) {} のとき、曲線はどのような特徴を持つか説明せよ。</p>
+            """.format(
+                tex("r"),
+                tex("d"),
+                tex("d = r"),
+                tex("d > r")
+            ),
+            "answer": """
+                <p><b>【解答】</b></p>
+                <p><b>(1) {} の場合：</b></p>
+                <p>これは通常のサイクロイドになります。曲線は尖点（カスプ）を持ち、最速降下線の性質を持ちます。</p>
+                <p><b>(2) {} の場合：</b></p>
+                <p>曲線は波打つ形状になり、ループを持ちます。追跡点が円周より外側にあるため、円が転がるときに一時的に後退する動きが生じ、これがループを形成します。</p>
+                <p>一般に、トロコイドの媒介変数表示は：</p>
+                <div align='center'>
+                {}<br>{}
+                </div>
+                <p>で与えられます。{} のとき、曲線は {} 軸と交差します。</p>
+            """.format(
+                tex("d = r"),
+                tex("d > r"),
+                tex(r"x = rt - d\sin t"),
+                tex(r"y = r - d\cos t"),
+                tex("d > r"),
+                tex("x")
+            )
+        },
+        5: {
+            "title": "【第6問】ハイポサイクロイドの特殊例（挑戦）",
+            "question": """
+                <p>半径 {} の固定円の内側を、半径 {} の円が転がるとき、転がる円周上の点が描く曲線について：</p>
+                <p>(1) {} のとき、曲線の名称と特徴を述べよ。</p>
+                <p>(2) {} のとき、曲線の名称を述べよ。</p>
+                <p>(3) 一般に {} のとき、曲線は何個の尖点を持つか答えよ。</p>
+            """.format(
+                tex("R"),
+                tex("r"),
+                tex("R = 4r"),
+                tex("R = 3r"),
+                tex("R = kr")
+            ),
+            "answer": """
+                <p><b>【解答】</b></p>
+                <p><b>(1) {} の場合：</b></p>
+                <p>これはアステロイド（星形）と呼ばれる曲線です。4つの尖点を持ち、方程式は：</p>
+                <div align='center'>
+                {}<br>{}
+                </div>
+                <p>または {} で表されます。</p>
+                <p><b>(2) {} の場合：</b></p>
+                <p>これはデルトイド（三角形風）と呼ばれる曲線です。3つの尖点を持ちます。</p>
+                <p><b>(3) 一般の場合：</b></p>
+                <p>ハイポサイクロイドは {} 個の尖点を持ちます。これは転がる円が固定円の内側を {} 周して元の位置に戻るためです。</p>
+            """.format(
+                tex("R = 4r"),
+                tex(r"x = a\cos^3 t"),
+                tex(r"y = a\sin^3 t"),
+                tex(r"x^{2/3} + y^{2/3} = a^{2/3}"),
+                tex("R = 3r"),
+                tex("k"),
+                tex("k")
+            )
+        }
     }
-}
+
+def _collect_latex(builder):
+    """builder が使用する (数式, フォントサイズ) の一覧を描画せずに集める"""
+    items = []
+    builder(lambda latex_str, fontsize=12: items.append((latex_str, fontsize)) or "")
+    return items
+
+@functools.lru_cache(maxsize=None)
+def get_exercise_data():
+    """練習問題データを初回アクセス時に構築して返す"""
+    print("数式画像を生成中...お待ちください...")
+    return _build_exercise_data(latex_to_html)
 
 # ---------------------------------------------------------
 # UI メインウィンドウ
@@ -772,21 +977,55 @@ class MainWindow(QMainWindow):
         self.init_viewer_ui()
         self.tabs.addTab(self.tab_viewer, "曲線ビューアー")
         
+        # 分類図と練習問題のタブは、初めて開いたときに中身を作る
         self.tab_tree = QWidget()
-        self.init_tree_ui()
         self.tabs.addTab(self.tab_tree, "分類図")
+        self._tree_inited = False
         
         self.tab_exercise = QWidget()
-        self.init_exercise_ui()
         self.tabs.addTab(self.tab_exercise, "練習問題 (数学Ⅲ)")
+        self._exercise_inited = False
+        self.tabs.currentChanged.connect(self.on_tab_change)
         
+        # 1回の描画は blit で軽くなったので、ディスプレイの更新間隔に合わせて回す
         self.timer = QTimer()
-        self.timer.setInterval(20) 
+        self.timer.setInterval(16)
         self.timer.timeout.connect(self.update_animation)
+        self._last_tick = 0.0
+        
+        # スライダーのドラッグ中は再描画要求をまとめ、止まってから1回だけ描く
+        # （再生中も表示範囲を新しいパラメータに合わせ直す）
+        self.redraw_timer = QTimer()
+        self.redraw_timer.setSingleShot(True)
+        self.redraw_timer.setInterval(30)
+        self.redraw_timer.timeout.connect(self.draw_static)
+        
+        # ラベルの文字が変わるとパネル全体のレイアウトと再描画が走るため、
+        # 再生中の t の表示は毎フレームではなく 0.1 秒ごとにまとめて更新する
+        self.label_timer = QTimer()
+        self.label_timer.setSingleShot(True)
+        self.label_timer.setInterval(100)
+        self.label_timer.timeout.connect(self.update_t_label)
         
         self.update_description()
         self.reset()
 
+    def on_tab_change(self, index):
+        widget = self.tabs.widget(index)
+        # ビューアーが見えていない間はアニメーションを止め、戻ったら続きから再生する
+        if widget is self.tab_viewer:
+            if self.is_playing and not self.timer.isActive():
+                self._last_tick = time.perf_counter()
+                self.timer.start()
+        else:
+            self.timer.stop()
+        if widget is self.tab_tree and not self._tree_inited:
+            self._tree_inited = True
+            self.init_tree_ui()
+        elif widget is self.tab_exercise and not self._exercise_inited:
+            self._exercise_inited = True
+            self.init_exercise_ui()
+
     def init_tree_ui(self):
         layout = QVBoxLayout(self.tab_tree)
         
@@ -798,15 +1037,27 @@ class MainWindow(QMainWindow):
         scroll = QScrollArea()
         scroll.setWidgetResizable(True)
         
-        svg_widget = QSvgWidget()
-        svg_widget.load(CLASSIFICATION_SVG.encode())
-        svg_widget.setMinimumSize(1600, 900)
+        # 分類図は静的なので、一度だけ QPixmap にラスタライズして表示する
+        renderer = QSvgRenderer(CLASSIFICATION_SVG_BYTES)
+        ratio = self.devicePixelRatioF()
+        image = QImage(renderer.defaultSize() * ratio, QImage.Format_ARGB32_Premultiplied)
+        image.fill(Qt.transparent)
+        painter = QPainter(image)
+        renderer.render(painter)
+        painter.end()
+        pixmap = QPixmap.fromImage(image)
+        pixmap.setDevicePixelRatio(ratio)
+        
+        svg_label = QLabel()
+        svg_label.setPixmap(pixmap)
+        svg_label.setAlignment(Qt.AlignCenter)
         
-        scroll.setWidget(svg_widget)
+        scroll.setWidget(svg_label)
         layout.addWidget(scroll)
 
     def init_viewer_ui(self):
         self.curve_type = "cycloid"
+        self._curve_fn = _CURVE_FUNCS[self.curve_type]
         self.radius = 50
         self.k_val = 3.0
         self.d_val = 50.0
@@ -975,6 +1226,16 @@ class MainWindow(QMainWindow):
         self.aux_rolling, = self.ax.plot([], [], 'g--', linewidth=1, alpha=0.7, label='転がる円') 
         self.aux_arm, = self.ax.plot([], [], 'g-', linewidth=1, alpha=0.7) 
         self.ax.legend(loc='upper right', fontsize='small')
+        # 表示範囲は静止描画のときだけ決め、アニメーション中は固定する
+        self.ax.set_autoscale_on(False)
+        # 動く要素は背景と分けて描き、フレームごとにそれだけを blit する
+        self._animated_artists = (self.aux_fixed, self.aux_rolling, self.aux_arm, self.line, self.point)
+        for artist in self._animated_artists:
+            artist.set_animated(True)
+        self._background = None
+        self._traj_key = None
+        self._aux_fixed_key = None
+        self.canvas.mpl_connect('draw_event', self.on_canvas_draw)
         layout.addWidget(self.canvas, stretch=1)
 
     def init_exercise_ui(self):
@@ -1025,9 +1286,9 @@ class MainWindow(QMainWindow):
         layout.addWidget(scroll_a)
         
         self.load_exercise(0)
-
+        
     def load_exercise(self, index):
-        data = EXERCISE_DATA[index]
+        data = get_exercise_data()[index]
         self.ex_title.setText(data["title"])
         self.ex_question.setHtml(data["question"])
         self.ex_answer.setHtml(data["answer"])
@@ -1048,6 +1309,8 @@ class MainWindow(QMainWindow):
                 "epicycloid", "epitrochoid", "hypocycloid", "hypotrochoid",
                 "lissajous", "rose"]
         self.curve_type = keys[index]
+        # 曲線が選ばれた時点で計算関数を解決しておき、描画ごとの辞書引きを省く
+        self._curve_fn = _CURVE_FUNCS[self.curve_type]
         self.update_description()
         self.update_parameter_meanings()
         self.reset()
@@ -1055,17 +1318,19 @@ class MainWindow(QMainWindow):
     def on_radius_change(self, value):
         self.radius = value
         self.lbl_radius.setText(f"半径 R: {self.radius}")
-        if not self.is_playing: self.draw_static()
+        self.redraw_timer.start()
 
     def on_k_change(self, value):
         self.k_val = float(value)
         self.lbl_k.setText(f"係数 K: {self.k_val}")
-        if not self.is_playing: self.draw_static()
+        # 再生中は再描画を待たずに次の更新から新しい終点で止める
+        self._max_t = CurveMath.get_max_t(self.curve_type, self.k_val)
+        self.redraw_timer.start()
         
     def on_d_change(self, value):
         self.d_val = float(value)
         self.lbl_d.setText(f"追跡点の距離 d: {self.d_val}")
-        if not self.is_playing: self.draw_static()
+        self.redraw_timer.start()
             
     def on_speed_change(self, value):
         self.speed = value
@@ -1079,6 +1344,7 @@ class MainWindow(QMainWindow):
         self.is_playing = not self.is_playing
         if self.is_playing:
             self.btn_play.setText("⏸ 一時停止")
+            self._last_tick = time.perf_counter()
             self.timer.start()
         else:
             self.btn_play.setText("▶ 再生")
@@ -1092,28 +1358,91 @@ class MainWindow(QMainWindow):
         self.draw_static()
         
     def update_animation(self):
-        max_t = CurveMath.get_max_t(self.curve_type, self.k_val)
-        dt = 0.01 * (self.speed / 5.0)
-        self.t_current += dt
+        max_t = self._max_t
+        # 実際の経過時間から毎秒 0.1·speed だけ進め、描画が間に合わなくても速さを一定にする
+        # （ウィンドウのドラッグ等で止まっていた分は飛ばさない）
+        now = time.perf_counter()
+        elapsed = min(now - self._last_tick, 0.1)
+        self._last_tick = now
+        self.t_current += elapsed * 0.1 * self.speed
         if self.t_current > max_t:
             self.t_current = max_t
             self.toggle_play() 
         self.update_plot(self.t_current)
         
+    def on_canvas_draw(self, event):
+        """全体を再描画したとき（表示範囲の変更・リサイズ）に背景を取り直す"""
+        self._background = self.canvas.copy_from_bbox(self.figure.bbox)
+        self.draw_animated()
+
+    def draw_animated(self):
+        for artist in self._animated_artists:
+            self.ax.draw_artist(artist)
+
+    def blit_animated(self):
+        if self._background is None:
+            self.canvas.draw_idle()
+            return
+        self.canvas.restore_region(self._background)
+        self.draw_animated()
+        self.canvas.blit(self.figure.bbox)
+
+    def apply_curve_params(self, key, current_t):
+        """曲線・パラメータが変わったときに、t によらない値をまとめて求め直す"""
+        self._traj_key = key
+        self._max_t = CurveMath.get_max_t(self.curve_type, self.k_val)
+        # 軌跡バッファは1周分確保する（一時停止中に K を下げると t が max_t を超えることがある）
+        size = int(max(self._max_t, current_t) * SAMPLES_PER_RAD) + 2
+        self._traj_x = np.empty(size)
+        self._traj_y = np.empty(size)
+        self._traj_n = 0
+        self._traj_t = 0.0
+        # 閉じた曲線は1周を超えると同じ線を重ねるだけなので、描くのは直近1周分に限る
+        period = CurveMath.get_period(self.curve_type, self.k_val)
+        self._traj_window = size if period is None else int(period * SAMPLES_PER_RAD) + 2
+        
+        length, area = CurveMath.calculate_stats(self.curve_type, self.radius, self.k_val, self.d_val, self._max_t)
+        self.lbl_length.setText(f"曲線の長さ: {length:.2f}")
+        self.lbl_area.setText(f"囲まれる面積: {area:.2f}")
+
     def draw_static(self):
         self.update_plot(self.t_current)
+        self.fit_view()
+
+    def fit_view(self):
+        """軌跡全体と補助円が収まるように表示範囲を合わせる"""
+        x0, x1, y0, y1 = CurveMath.get_bounds(self.curve_type, self.radius, self.k_val, self.d_val)
+        mx, my = 0.1 * (x1 - x0), 0.1 * (y1 - y0)
+        self.ax.set_xlim(x0 - mx, x1 + mx)
+        self.ax.set_ylim(y0 - my, y1 + my)
+        self.canvas.draw_idle()
         
     def update_plot(self, current_t):
-        t_vals = np.linspace(0, current_t, int(current_t * 50) + 10)
-        xs = []
-        ys = []
-        for t in t_vals:
-            x, y = CurveMath.get_point(self.curve_type, t, self.radius, self.k_val, self.d_val)
-            xs.append(x)
-            ys.append(y)
-        self.line.set_data(xs, ys)
+        curve_fn = self._curve_fn
+        # 軌跡は等間隔の t で計算した点をバッファに溜め、前回から増えた分だけ計算する
+        key = (self.curve_type, self.radius, self.k_val, self.d_val)
+        if key != self._traj_key:
+            self.apply_curve_params(key, current_t)
+        elif current_t < self._traj_t:
+            # リセットで t が戻ったら軌跡を先頭から溜め直す
+            self._traj_n = 0
+        n_done = self._traj_n
+        n_need = int(current_t * SAMPLES_PER_RAD) + 1
+        if n_need > n_done:
+            t_new = np.arange(n_done, n_need) / SAMPLES_PER_RAD
+            xs, ys = curve_fn(t_new, self.radius, self.k_val, self.d_val)
+            self._traj_x[n_done:n_need] = xs
+            self._traj_y[n_done:n_need] = ys
+            self._traj_n = n_need
+        self._traj_t = current_t
+        
+        # 現在の点だけ math でスカラー計算し、軌跡の末尾にもつなげる
+        cx, cy = curve_fn(current_t, self.radius, self.k_val, self.d_val, math)
+        self._traj_x[n_need] = cx
+        self._traj_y[n_need] = cy
+        start = max(0, n_need - self._traj_window)
+        self.line.set_data(self._traj_x[start:n_need + 1], self._traj_y[start:n_need + 1])
         
-        cx, cy = CurveMath.get_point(self.curve_type, current_t, self.radius, self.k_val, self.d_val)
         self.point.set_data([cx], [cy])
         
         if self.show_aux:
@@ -1121,7 +1450,11 @@ class MainWindow(QMainWindow):
                 self.curve_type, current_t, self.radius, self.k_val, self.d_val
             )
             if fixed_data is not None:
-                self.aux_fixed.set_data(fixed_data[0], fixed_data[1])
+                # 固定円/線は t によらないので、パラメータが変わったときだけ渡し直す
+                # （set_data のたびに Line2D が描画用のパスを作り直すのを避ける）
+                if self._aux_fixed_key != self._traj_key:
+                    self._aux_fixed_key = self._traj_key
+                    self.aux_fixed.set_data(fixed_data[0], fixed_data[1])
                 self.aux_rolling.set_data(roll_data[0], roll_data[1])
                 self.aux_arm.set_data([center_data[0], cx], [center_data[1], cy])
                 self.aux_fixed.set_visible(True)
@@ -1136,18 +1469,16 @@ class MainWindow(QMainWindow):
             self.aux_rolling.set_visible(False)
             self.aux_arm.set_visible(False)
         
-        self.ax.relim()
-        self.ax.autoscale_view()
-        self.ax.margins(0.1)
-        self.canvas.draw_idle()
-        
-        max_t_for_calc = CurveMath.get_max_t(self.curve_type, self.k_val)
-        length, area = CurveMath.calculate_stats(self.curve_type, self.radius, self.k_val, self.d_val, max_t_for_calc)
-        deg_current = np.degrees(current_t)
+        self.blit_animated()
         
-        self.lbl_length.setText(f"曲線の長さ: {length:.2f}")
-        self.lbl_area.setText(f"囲まれる面積: {area:.2f}")
-        self.lbl_t.setText(f"パラメータ t: {current_t:.2f} ({deg_current:.1f}°) / {max_t_for_calc:.2f}")
+        if not self.is_playing:
+            self.update_t_label()
+        elif not self.label_timer.isActive():
+            self.label_timer.start()
+
+    def update_t_label(self):
+        deg_current = math.degrees(self.t_current)
+        self.lbl_t.setText(f"パラメータ t: {self.t_current:.2f} ({deg_current:.1f}°) / {self._max_t:.2f}")
 
     def update_parameter_meanings(self):
         """K と d パラメータの意味を更新"""
@@ -1185,6 +1516,9 @@ class MainWindow(QMainWindow):
         self.text_desc.setHtml(html)
 
 if __name__ == "__main__":
+    # 練習問題の数式画像はウィンドウ表示と並行して裏で描画しておく
+    threading.Thread(target=_prerender_latex, args=(_collect_latex(_build_exercise_data),),
+                     daemon=True).start()
     app = QApplication(sys.argv)
     app.setStyle("Fusion")
     window = MainWindow()